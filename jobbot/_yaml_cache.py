@@ -0,0 +1,40 @@
+# _yaml_cache.py
+"""
+Shared cache for YAML config files.
+
+load_yaml_cached(path) parses a file once per process and serves later calls from memory
+until the file changes on disk (checked via its mtime, size and inode). Callers get a deep
+copy, so mutating the returned config never leaks into other modules.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+import yaml
+
+MAX_ENTRIES = 100  # least recently used files are evicted past this
+
+_cache = OrderedDict()  # absolute path -> (mtime_ns, size, inode, parsed data)
+_lock = threading.Lock()
+
+def load_yaml_cached(path):
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = os.path.abspath(path)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[:3] == signature:
+            _cache.move_to_end(key)
+            return copy.deepcopy(entry[3])
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    with _lock:
+        _cache[key] = (*signature, data)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return copy.deepcopy(data)
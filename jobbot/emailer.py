@@ -1,19 +1,19 @@
 # emailer.py
+import logging
 import os
 import ssl
 import smtplib
 from email.message import EmailMessage
 from email.utils import formataddr
 
-def send_email(smtp_user, smtp_pass, to_email, subject, body_text, attachments=[]):
+log = logging.getLogger("jobbot")
+
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+
+def build_message(smtp_user, to_email, subject, body_text, attachments=()):
     """
-    Send an email with a plain-text body and optional PDF attachments.
-    smtp_user: SMTP username (email address)
-    smtp_pass: SMTP password (app password recommended for Gmail)
-    to_email: destination email (your email)
-    subject: email subject
-    body_text: plain-text body (can contain the text resume)
-    attachments: list of file paths to attach (PDFs)
+    Build an EmailMessage with a plain-text body and optional PDF attachments.
     """
     msg = EmailMessage()
     msg["From"] = formataddr(("Sandeep Sharma", smtp_user))
@@ -24,20 +24,95 @@ def send_email(smtp_user, smtp_pass, to_email, subject, body_text, attachments=[
     # Attach PDFs
     for path in attachments:
         try:
+            # each tailored PDF is attached once, so read it fresh and let it go with the message
             with open(path, "rb") as f:
                 data = f.read()
-            filename = path.split("/")[-1]
+            filename = os.path.basename(path)
             msg.add_attachment(data, maintype="application", subtype="pdf", filename=filename)
         except Exception as e:
-            print(f"Warning: could not attach {path} -> {e}")
-
-    # Send via Gmail SMTP (SSL)
-    context = ssl.create_default_context()
-    try:
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465, context=context) as server:
-            server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
-        print(f"Email sent to {to_email} with subject: {subject}")
-    except Exception as e:
-        print("Error sending email:", e)
-        raise
+            log.warning("Could not attach %s -> %s", path, e)
+
+    return msg
+
+class Mailer:
+    """
+    One authenticated Gmail SMTP (SSL) connection reused for a batch of emails,
+    so the TCP+TLS handshake and login happen once instead of once per email.
+
+        with Mailer(smtp_user, smtp_pass) as mailer:
+            for job in jobs:
+                mailer.send(to_email, subject, body_text, attachments=[pdf_path])
+
+    send() also connects on first use, so a Mailer can be used without `with`
+    as long as close() is called at the end.
+    """
+
+    def __init__(self, smtp_user, smtp_pass, host=SMTP_HOST, port=SMTP_PORT):
+        self.smtp_user = smtp_user
+        self.smtp_pass = smtp_pass
+        self.host = host
+        self.port = port
+        self.server = None
+
+    def connect(self):
+        if self.server is None:
+            context = ssl.create_default_context()
+            try:
+                server = smtplib.SMTP_SSL(self.host, self.port, context=context)
+                try:
+                    server.login(self.smtp_user, self.smtp_pass)
+                except Exception:
+                    server.close()
+                    raise
+            except Exception as e:
+                log.error("Error connecting to SMTP server: %s", e)
+                raise
+            self.server = server
+        return self.server
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.server = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def send(self, to_email, subject, body_text, attachments=()):
+        """
+        Send one email over the shared connection (see send_email for the arguments).
+        """
+        msg = build_message(self.smtp_user, to_email, subject, body_text, attachments)
+        try:
+            try:
+                self.connect().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # server dropped the idle connection; reconnect once and retry
+                self.server = None
+                self.connect().send_message(msg)
+            log.info("Email sent to %s with subject: %s", to_email, subject)
+        except Exception as e:
+            log.error("Error sending email: %s", e)
+            raise
+
+def send_email(smtp_user, smtp_pass, to_email, subject, body_text, attachments=[]):
+    """
+    Send an email with a plain-text body and optional PDF attachments.
+    smtp_user: SMTP username (email address)
+    smtp_pass: SMTP password (app password recommended for Gmail)
+    to_email: destination email (your email)
+    subject: email subject
+    body_text: plain-text body (can contain the text resume)
+    attachments: list of file paths to attach (PDFs)
+
+    Opens a connection for this one email; use Mailer to send several over one connection.
+    """
+    with Mailer(smtp_user, smtp_pass) as mailer:
+        mailer.send(to_email, subject, body_text, attachments)
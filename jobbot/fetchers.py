@@ -3,10 +3,12 @@
 Robust job fetchers for JobBot.
 
 Provides:
-- requests_session_with_retries(...) : HTTP session with sensible headers + retries
+- requests_session_with_retries(...) : HTTP session with sensible headers + retries + on-disk cache
 - fetch_linkedin_jobs(query, location) : indirect LinkedIn discovery via Google search (no direct scraping of LinkedIn)
 - fetch_indeed(query, location)      : basic Indeed scraping (may 403 from Actions IPs)
 - fetch_company_jobs(url)            : heuristic scraping of company career pages (follows job-like links)
+- fetch_company_pages(urls)          : many company career pages concurrently (asyncio + httpx)
+- fetch_multiple_sources(...)        : all of the above concurrently (asyncio + httpx)
 
 Each fetcher returns a list of job dicts:
 {
@@ -22,56 +24,163 @@ Each fetcher returns a list of job dicts:
 
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse, unquote
+from urllib.robotparser import RobotFileParser
+from collections import defaultdict
+from itertools import takewhile
+import asyncio
+import random
+import re
+try:
+    import re2  # google-re2: linear-time matching, no backtracking on hostile input
+except ImportError:
+    re2 = re
+import threading
 import time
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import requests_cache
+from selectolax.lexbor import LexborHTMLParser
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # -------------------------
 # Session with retries & friendly headers
 # -------------------------
+# On-disk HTTP cache (sqlite); stale entries are revalidated with ETag / Last-Modified
+HTTP_CACHE_PATH = "jobbot/jobbot_http"
+HTTP_CACHE_EXPIRE = 3600  # seconds
+
+# Browser-like headers (helps some sites avoid trivial bot blocks)
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://www.google.com/",
+}
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with capped exponential backoff and +/-50% jitter, so retries from
+    concurrent workers against the same host (Google, Indeed) don't line up.
+    A Retry-After header on 429/503 still takes precedence over the computed backoff.
+    """
+    BACKOFF_CAP = 30.0
+
+    def get_backoff_time(self):
+        # number of consecutive errors (redirects reset the streak), as in urllib3
+        attempt = len(list(takewhile(lambda h: h.redirect_location is None, reversed(self.history))))
+        if attempt == 0:
+            return 0
+        return min(self.BACKOFF_CAP, self.backoff_factor * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
 def requests_session_with_retries(
     total_retries: int = 5,
     backoff: float = 1.0,
-    status_forcelist=(429, 500, 502, 503, 504)
+    status_forcelist=(429, 500, 502, 503, 504),
+    pool_size: int = 32
 ):
-    s = requests.Session()
-    retries = Retry(
+    s = requests_cache.CachedSession(
+        cache_name=HTTP_CACHE_PATH,
+        backend="sqlite",
+        expire_after=HTTP_CACHE_EXPIRE,
+        cache_control=True,
+    )
+    retries = JitteredRetry(
         total=total_retries,
         backoff_factor=backoff,
         status_forcelist=status_forcelist,
-        allowed_methods=frozenset(["GET", "POST"])
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    # keep more than urllib3's default of 10 hosts / connections pooled
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=pool_size, pool_maxsize=pool_size)
     s.mount("https://", adapter)
     s.mount("http://", adapter)
 
-    # Browser-like headers (helps some sites avoid trivial bot blocks)
-    s.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://www.google.com/",
-    })
+    s.headers.update(BROWSER_HEADERS)
     return s
 
+# shared by all fetchers so connections (and TLS sessions) are kept alive between calls;
+# created on first fetch, so importing this module does not open the sqlite cache
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _shared_session():
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = requests_session_with_retries()
+    return _SESSION
+
+# -------------------------
+# Per-host politeness
+# -------------------------
+POLITE_DELAY = 1.5  # seconds between two requests to the same host, unless robots.txt says otherwise
+
+_crawl_delays = {}  # netloc -> delay in seconds (robots.txt Crawl-delay or POLITE_DELAY)
+_last_hit = {}      # netloc -> time.monotonic() at which the latest request to it was allowed to start
+_last_hit_lock = threading.Lock()
+
+def _parse_crawl_delay(robots_txt):
+    rp = RobotFileParser()
+    rp.parse(robots_txt.splitlines())
+    return rp.crawl_delay(BROWSER_HEADERS["User-Agent"])
+
+def _host_delay(url, session):
+    """Crawl-delay advertised in the host's robots.txt, else POLITE_DELAY. Looked up once per host."""
+    host = urlparse(url).netloc
+    if host not in _crawl_delays:
+        delay = None
+        try:
+            r = session.get(urljoin(url, "/robots.txt"), timeout=10)
+            if r.status_code == 200:
+                delay = _parse_crawl_delay(r.text)
+        except Exception:
+            pass
+        _crawl_delays[host] = POLITE_DELAY if delay is None else float(delay)
+    return _crawl_delays[host]
+
+def _reserve_host_slot(url, delay):
+    """Book the next start time for url's host; returns how long the caller must wait."""
+    host = urlparse(url).netloc
+    with _last_hit_lock:
+        now = time.monotonic()
+        start = max(now, _last_hit.get(host, float("-inf")) + delay)
+        _last_hit[host] = start
+    return start - now
+
+def _wait_for_host(url, session):
+    time.sleep(_reserve_host_slot(url, _host_delay(url, session)))
+
+# -------------------------
+# HTML text
+# -------------------------
+def _node_text(node, separator=""):
+    """
+    Text of node and its descendants: each text node stripped, empty ones dropped, the rest
+    joined by separator (what BeautifulSoup's get_text(separator, strip=True) returned).
+    Lexbor's own strip=True keeps the separator around whitespace-only nodes, which left
+    double and leading spaces in titles and snippets.
+    """
+    parts = node.text(deep=True, separator="\x00").split("\x00")  # the parser never emits NUL
+    return separator.join(filter(None, (t.strip() for t in parts)))
+
 # -------------------------
 # LinkedIn discovery via Google search (indirect)
 # -------------------------
-def fetch_linkedin_jobs(query: str = "Azure Data Engineer", location: str = "Hyderabad"):
+def fetch_linkedin_jobs(query: str = "Azure Data Engineer", location: str = "Hyderabad", session=None):
     """
     Discover LinkedIn job links by scraping Google search results for 'site:linkedin.com/jobs ...'
     This avoids direct LinkedIn scraping (which is blocked aggressively).
     Returns list of job dicts.
     """
-    session = requests_session_with_retries()
+    if session is None:
+        session = _shared_session()
     google_query = f"site:linkedin.com/jobs {query} {location}"
     url = "https://www.google.com/search"
     params = {"q": google_query, "num": 10}
 
-    jobs = []
     try:
         resp = session.get(url, params=params, timeout=30)
         resp.raise_for_status()
@@ -79,28 +188,32 @@ def fetch_linkedin_jobs(query: str = "Azure Data Engineer", location: str = "Hyd
         print("LinkedIn (via Google) fetch failed:", e)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    return _parse_linkedin_results(resp.text, location)
+
+# LinkedIn job pages (/jobs/view/..., /jobs/search/..., /jobs/<slug>)
+_LI_JOB_RE = re2.compile(r"linkedin\.com/jobs/")
+
+def _parse_linkedin_results(body, location):
+    tree = LexborHTMLParser(body)
+    now_iso = datetime.now(timezone.utc).isoformat()  # same fetch time for every job on the page
+    jobs = []
 
     # Google search result anchors typically use /url?q=...
-    anchors = soup.select("a")
+    anchors = tree.css("a")
     seen = set()
     for a in anchors:
-        href = a.get("href", "")
+        href = a.attributes.get("href") or ""
         if not href.startswith("/url?q="):
             continue
-        real_url = href.replace("/url?q=", "").split("&")[0]
-        real_url = unquote(real_url)
-
-        # only accept linkedin job links
-        if "linkedin.com/jobs" not in real_url:
-            continue
+        real_url = href[len("/url?q="):].partition("&")[0]
+        if "%" in real_url:
+            real_url = unquote(real_url)
 
-        # prefer view links; filter noisy redirectors
-        if not any(x in real_url for x in ("/jobs/view", "/jobs/search", "/jobs/")):
-            # still may be useful, but skip noisy pages
+        # only accept linkedin job links; skip noisy redirectors
+        if not _LI_JOB_RE.search(real_url):
             continue
 
-        title = a.get_text(" ", strip=True) or "LinkedIn Job"
+        title = _node_text(a, " ") or "LinkedIn Job"
         if real_url in seen:
             continue
         seen.add(real_url)
@@ -111,7 +224,7 @@ def fetch_linkedin_jobs(query: str = "Azure Data Engineer", location: str = "Hyd
             "company": "LinkedIn",
             "link": real_url,
             "snippet": "Found via Google search",
-            "posted_at": datetime.now(timezone.utc).isoformat(),
+            "posted_at": now_iso,
             "location": location
         })
 
@@ -120,14 +233,15 @@ def fetch_linkedin_jobs(query: str = "Azure Data Engineer", location: str = "Hyd
 # -------------------------
 # Indeed fetcher (simple)
 # -------------------------
-def fetch_indeed(query: str = "Azure Data Engineer", location: str = "Hyderabad"):
+def fetch_indeed(query: str = "Azure Data Engineer", location: str = "Hyderabad", session=None):
     """
     Basic scraping of in.indeed.com search results.
     Note: Indeed often blocks automated requests from cloud runners; expect 403 sometimes.
     """
     base = "https://in.indeed.com/jobs"
     params = {"q": query, "l": location}
-    session = requests_session_with_retries()
+    if session is None:
+        session = _shared_session()
 
     try:
         resp = session.get(base, params=params, timeout=30)
@@ -136,12 +250,16 @@ def fetch_indeed(query: str = "Azure Data Engineer", location: str = "Hyderabad"
         print("Error fetching Indeed jobs:", e)
         return []
 
+    return _parse_indeed_results(resp.text, location)
+
+def _parse_indeed_results(body, location):
     try:
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = LexborHTMLParser(body)
     except Exception as e:
         print("Error parsing Indeed HTML:", e)
         return []
 
+    now_iso = datetime.now(timezone.utc).isoformat()  # same fetch time for every job on the page
     jobs = []
     card_selectors = [
         ".jobsearch-SerpJobCard",  # older Indeed
@@ -149,31 +267,33 @@ def fetch_indeed(query: str = "Azure Data Engineer", location: str = "Hyderabad"
         "a.tapItem",               # newer mobile layout
     ]
 
+    # first layout that matches wins; Lexbor returns a node once per selector of a union,
+    # and a union would also mix cards nested across layouts
     cards = []
     for sel in card_selectors:
-        found = soup.select(sel)
+        found = tree.css(sel)
         if found:
             cards = found
             break
 
     for card in cards:
         # title
-        title_tag = card.select_one("h2.jobTitle") or card.select_one(".jobTitle") or card.select_one(".title")
-        title = title_tag.get_text(strip=True) if title_tag else ""
+        title_tag = card.css_first("h2.jobTitle") or card.css_first(".jobTitle") or card.css_first(".title")
+        title = _node_text(title_tag) if title_tag else ""
 
         # company
-        company_tag = card.select_one(".companyName") or card.select_one(".company")
-        company = company_tag.get_text(strip=True) if company_tag else ""
+        company_tag = card.css_first(".companyName") or card.css_first(".company")
+        company = _node_text(company_tag) if company_tag else ""
 
         # snippet/summary
-        snippet_tag = card.select_one(".job-snippet") or card.select_one(".summary") or card.select_one(".jobCardShelfContainer")
-        snippet = snippet_tag.get_text(" ", strip=True) if snippet_tag else ""
+        snippet_tag = card.css_first(".job-snippet") or card.css_first(".summary") or card.css_first(".jobCardShelfContainer")
+        snippet = _node_text(snippet_tag, " ") if snippet_tag else ""
 
         # link
-        link_tag = card.select_one("a") or card.select_one("a.jobtitle")
+        link_tag = card.css_first("a") or card.css_first("a.jobtitle")
         link = ""
-        if link_tag and link_tag.get("href"):
-            href = link_tag.get("href").strip()
+        if link_tag and link_tag.attributes.get("href"):
+            href = link_tag.attributes["href"].strip()
             if href.startswith("http"):
                 link = href
             else:
@@ -185,7 +305,7 @@ def fetch_indeed(query: str = "Azure Data Engineer", location: str = "Hyderabad"
             "company": company,
             "link": link,
             "snippet": snippet,
-            "posted_at": datetime.now(timezone.utc).isoformat(),
+            "posted_at": now_iso,
             "location": location
         })
 
@@ -194,22 +314,28 @@ def fetch_indeed(query: str = "Azure Data Engineer", location: str = "Hyderabad"
 # ------------------------------------------------------------
 # Fetch jobs from a company careers page (heuristic)
 # ------------------------------------------------------------
+# path segments that suggest a job posting, and title words for data/engineering roles
+_JOB_PATH_WORDS = ("job", "career", "opening", "position", "role", "apply", "vacancy", "opportunity", "posting")
+_JOB_PATH_RE = re2.compile("(?i)" + "|".join(_JOB_PATH_WORDS))
+# CSS pre-filter evaluated inside the parser: only anchors whose href can pass _JOB_PATH_RE
+_JOB_ANCHOR_CSS = ", ".join(f'a[href*="{w}" i]' for w in _JOB_PATH_WORDS)
+# relative hrefs ("x", "?p=2", "#top") resolve onto the page's own path, which may be the job-like part
+_RELATIVE_ANCHOR_CSS = 'a[href]:not([href^="/"]):not([href^="http" i])'
+_SKILL_RE = re2.compile(r"(?i)data|engineer|analytics|analyst|scientist|databricks|azure|etl|spark")
+_SNIPPET_SKILL_RE = re2.compile(r"(?i)data|engineer|azure")
+
 def fetch_company_jobs(url: str, session=None):
     """
     Fetch job links heuristically from a company careers page.
     Only returns links that look like job postings (path contains job/careers/openings/apply/etc).
     """
-    if not url:
-        return []
-
-    parsed = urlparse(url)
-    if not parsed.scheme:
-        print("Skipping invalid company URL (no scheme):", url)
+    if not _is_valid_company_url(url):
         return []
 
     if session is None:
-        session = requests_session_with_retries()
+        session = _shared_session()
 
+    _wait_for_host(url, session)  # per-host politeness; other hosts are not held up
     try:
         r = session.get(url, timeout=30)
         r.raise_for_status()
@@ -217,18 +343,35 @@ def fetch_company_jobs(url: str, session=None):
         print(f"Error fetching company careers from {url}: {e}")
         return []
 
+    return _parse_company_jobs(r.text, url)
+
+def _is_valid_company_url(url):
+    if not url:
+        return False
+    if not urlparse(url).scheme:
+        print("Skipping invalid company URL (no scheme):", url)
+        return False
+    return True
+
+def _parse_company_jobs(body, url):
     try:
-        soup = BeautifulSoup(r.text, "html.parser")
+        tree = LexborHTMLParser(body)
     except Exception as e:
         print("Error parsing HTML from", url, e)
         return []
 
+    now_iso = datetime.now(timezone.utc).isoformat()  # same fetch time for every job on the page
+    parsed = urlparse(url)
+    company_domain = parsed.netloc
+    selector = _JOB_ANCHOR_CSS
+    if _JOB_PATH_RE.search(parsed.path):
+        selector += ", " + _RELATIVE_ANCHOR_CSS
+
     jobs = []
     seen_links = set()
 
-    for a in soup.select("a"):
-        href = a.get("href", "").strip()
-        text = a.get_text(" ", strip=True).strip()
+    for a in tree.css(selector):
+        href = (a.attributes.get("href") or "").strip()
         if not href:
             continue
 
@@ -239,13 +382,15 @@ def fetch_company_jobs(url: str, session=None):
             except Exception:
                 continue
 
+        link_key = href.partition("?")[0]
+        if link_key in seen_links:
+            continue
+
+        text = _node_text(a, " ")
+
         # filter out obviously non-job links by path segment
-        job_path_indicators = (
-            "job", "jobs", "careers", "career", "openings", "positions",
-            "role", "apply", "vacancy", "opportunity", "posting"
-        )
         parsed_href = urlparse(href)
-        if not any(ind in parsed_href.path.lower() for ind in job_path_indicators):
+        if not _JOB_PATH_RE.search(parsed_href.path):
             # sometimes job lists are on different domains or require JS; skip these noisy links
             continue
 
@@ -253,17 +398,12 @@ def fetch_company_jobs(url: str, session=None):
         cand_title = text or parsed_href.path.split("/")[-1].replace("-", " ").replace("_", " ")
 
         # Basic keyword filter for data/engineering-related roles
-        lowered = cand_title.lower()
-        if not any(k in lowered for k in ("data", "engineer", "analytics", "analyst", "scientist", "databricks", "azure", "etl", "spark")):
+        if not _SKILL_RE.search(cand_title):
             # still allow some cases where snippet contains keywords
-            snippet_lower = (a.get("aria-label","") + " " + a.get("title","")).lower()
-            if not any(k in snippet_lower for k in ("data", "engineer", "azure")):
+            snippet = (a.attributes.get("aria-label") or "") + " " + (a.attributes.get("title") or "")
+            if not _SNIPPET_SKILL_RE.search(snippet):
                 continue
 
-        company_domain = parsed.netloc or urlparse(url).netloc
-        link_key = href.split("?")[0]
-        if link_key in seen_links:
-            continue
         seen_links.add(link_key)
 
         jobs.append({
@@ -272,38 +412,179 @@ def fetch_company_jobs(url: str, session=None):
             "company": company_domain,
             "link": href,
             "snippet": text,
-            "posted_at": datetime.now(timezone.utc).isoformat(),
+            "posted_at": now_iso,
             "location": ""
         })
 
     return jobs
 
 # -------------------------
-# Convenience: aggregate multiple sources (optional utility)
+# Async fetchers (httpx) used by the aggregate
 # -------------------------
-def fetch_multiple_sources(query="Azure Data Engineer", location="Hyderabad", company_pages=None):
+def _async_client():
+    return httpx.AsyncClient(
+        headers=BROWSER_HEADERS,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        timeout=30.0,
+        follow_redirects=True,
+    )
+
+MAX_CONCURRENT_FETCHES = 8  # requests in flight at once, across all hosts
+MAX_PER_HOST = 2            # requests in flight at once to one host
+
+class _AsyncLimits:
     """
-    Helper that fetches from LinkedIn (via Google), Indeed, and a list of company pages.
-    Returns a combined list of job dicts.
+    Concurrency caps shared by one batch of async fetches: a global semaphore, one semaphore
+    per host, and one lock per host so that concurrent first requests to a host look up its
+    robots.txt once. Build it inside the running event loop.
     """
-    out = []
+    def __init__(self):
+        self.total = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self.per_host = defaultdict(lambda: asyncio.Semaphore(MAX_PER_HOST))
+        self.robots_locks = defaultdict(asyncio.Lock)
+
+    def host(self, url):
+        return self.per_host[urlparse(url).netloc]
+
+# The httpx path has no urllib3 Retry behind it, so the same policy is applied by hand:
+# up to RETRY_TOTAL retries on connection errors and RETRY_STATUSES, jittered exponential
+# backoff, and Retry-After honoured when the server sends it.
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 1.0
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_RETRY_AFTER_PARSER = JitteredRetry(0)  # only used for its Retry-After parsing
+
+async def _get_with_retries(client, url, **kwargs):
+    for attempt in range(RETRY_TOTAL + 1):
+        retry_after = None
+        try:
+            resp = await client.get(url, **kwargs)
+        except httpx.TransportError:
+            if attempt == RETRY_TOTAL:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return resp
+            header = resp.headers.get("Retry-After")
+            if header:
+                try:
+                    retry_after = _RETRY_AFTER_PARSER.parse_retry_after(header)
+                except Exception:
+                    pass
+        backoff = min(JitteredRetry.BACKOFF_CAP, RETRY_BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.5)
+        await asyncio.sleep(retry_after if retry_after is not None else backoff)
+
+async def _fetch_linkedin_jobs_async(client, limits, query, location):
+    params = {"q": f"site:linkedin.com/jobs {query} {location}", "num": 10}
     try:
-        out += fetch_linkedin_jobs(query=query, location=location)
+        async with limits.total:
+            resp = await _get_with_retries(client, "https://www.google.com/search", params=params)
+        resp.raise_for_status()
     except Exception as e:
-        print("LinkedIn fetch failed (aggregate):", e)
+        print("LinkedIn (via Google) fetch failed:", e)
+        return []
+    return _parse_linkedin_results(resp.text, location)
 
+async def _fetch_indeed_async(client, limits, query, location):
     try:
-        out += fetch_indeed(query=query, location=location)
+        async with limits.total:
+            resp = await _get_with_retries(client, "https://in.indeed.com/jobs", params={"q": query, "l": location})
+        resp.raise_for_status()
     except Exception as e:
-        print("Indeed fetch failed (aggregate):", e)
+        print("Error fetching Indeed jobs:", e)
+        return []
+    return _parse_indeed_results(resp.text, location)
+
+async def _host_delay_async(client, limits, url):
+    host = urlparse(url).netloc
+    if host not in _crawl_delays:
+        async with limits.robots_locks[host]:
+            # re-check: another task may have fetched it while this one waited for the lock
+            if host not in _crawl_delays:
+                delay = None
+                try:
+                    async with limits.total:
+                        r = await client.get(urljoin(url, "/robots.txt"), timeout=10)
+                    if r.status_code == 200:
+                        delay = _parse_crawl_delay(r.text)
+                except Exception:
+                    pass
+                _crawl_delays[host] = POLITE_DELAY if delay is None else float(delay)
+    return _crawl_delays[host]
+
+async def _fetch_company_jobs_async(client, limits, url):
+    """
+    Async counterpart of fetch_company_jobs, sharing its per-host politeness state.
+    """
+    if not _is_valid_company_url(url):
+        return []
 
-    if company_pages:
-        session = requests_session_with_retries()
-        for u in company_pages:
-            try:
-                out += fetch_company_jobs(u, session=session)
-                time.sleep(1.5)  # polite pause between company pages
-            except Exception as e:
-                print("Company fetch failed for", u, e)
+    try:
+        async with limits.host(url):
+            await asyncio.sleep(_reserve_host_slot(url, await _host_delay_async(client, limits, url)))
+            async with limits.total:
+                r = await _get_with_retries(client, url)
+        r.raise_for_status()
+    except Exception as e:
+        print(f"Error fetching company careers from {url}: {e}")
+        return []
 
+    return _parse_company_jobs(r.text, url)
+
+# -------------------------
+# Convenience: aggregate multiple sources (optional utility)
+# -------------------------
+async def _gather_sources(named_coros, timeout):
+    """Run (name, coroutine) pairs concurrently; failed or timed-out sources are logged and skipped."""
+    results = await asyncio.gather(
+        *(asyncio.wait_for(c, timeout) for _, c in named_coros),
+        return_exceptions=True,
+    )
+    out = []
+    for (name, _), res in zip(named_coros, results):
+        if isinstance(res, BaseException):
+            print("Fetch failed (aggregate) for", name, repr(res))
+            continue
+        out += res
     return out
+
+async def fetch_company_pages_async(company_pages, timeout=120):
+    """
+    Fetch all company career pages concurrently on one httpx.AsyncClient, at most
+    MAX_CONCURRENT_FETCHES at a time and MAX_PER_HOST per host. Pages on the same host are
+    also spaced by the host's crawl delay. Returns a combined list of job dicts in page order.
+    Unlike fetch_company_jobs, this path does not go through the requests-cache store: every
+    page is downloaded again on each run, in exchange for fetching all hosts in parallel.
+    """
+    limits = _AsyncLimits()
+    async with _async_client() as client:
+        return await _gather_sources([(u, _fetch_company_jobs_async(client, limits, u)) for u in company_pages], timeout)
+
+def fetch_company_pages(company_pages, timeout=120):
+    """Blocking wrapper around fetch_company_pages_async."""
+    return asyncio.run(fetch_company_pages_async(company_pages, timeout))
+
+async def fetch_multiple_sources_async(query="Azure Data Engineer", location="Hyderabad", company_pages=None, timeout=120):
+    """
+    Fetch LinkedIn (via Google), Indeed and all company pages concurrently on one
+    httpx.AsyncClient, with the same concurrency caps and per-host spacing as
+    fetch_company_pages_async. Sources still running after `timeout` seconds are dropped.
+    Returns a combined list of job dicts in source order.
+    """
+    limits = _AsyncLimits()
+    async with _async_client() as client:
+        named_coros = [
+            ("LinkedIn", _fetch_linkedin_jobs_async(client, limits, query, location)),
+            ("Indeed", _fetch_indeed_async(client, limits, query, location)),
+        ]
+        named_coros += [(u, _fetch_company_jobs_async(client, limits, u)) for u in company_pages or []]
+        return await _gather_sources(named_coros, timeout)
+
+def fetch_multiple_sources(query="Azure Data Engineer", location="Hyderabad", company_pages=None, timeout=120):
+    """
+    Helper that fetches from LinkedIn (via Google), Indeed, and a list of company pages.
+    Blocking wrapper around fetch_multiple_sources_async.
+    Returns a combined list of job dicts.
+    """
+    return asyncio.run(fetch_multiple_sources_async(query, location, company_pages, timeout))
@@ -1,5 +1,6 @@
 # matcher.py
 import re
+import ahocorasick
 
 SENIOR_KEYWORDS = ["senior", "sr.", "lead", "principal", "staff", "manager", "architect"]
 JUNIOR_KEYWORDS = ["intern", "junior", "jr.", "trainee", "fresher", "entry"]
@@ -24,37 +25,87 @@ SENIOR_BONUS = 25  # senior-level titles get boost
 LOCATION_BONUS = 20 # Hyderabad preferred
 SPONSOR_BONUS = 20  # if job mentions sponsor/visa/relocation
 
+LOCATION_KEYWORD = "hyderabad"
+VISA_KEYWORDS = ["visa", "sponsor", "sponsorship", "relocation"]
+BASE_KEYWORDS = ["data", "engineer"]  # small base bump for any data/engineering mention
+
+def _build_automaton():
+    """One Aho-Corasick automaton over every keyword score_job looks for."""
+    automaton = ahocorasick.Automaton()
+    for k in [*SENIOR_KEYWORDS, *JUNIOR_KEYWORDS, *SKILL_KEYWORDS, LOCATION_KEYWORD, *VISA_KEYWORDS, *BASE_KEYWORDS]:
+        automaton.add_word(k, k)
+    automaton.make_automaton()
+    return automaton
+
+AUTOMATON = _build_automaton()
+# stays on stdlib re: RE2's \b is ASCII-only
+_TITLE_RE = re.compile(r"\bdata engineer\b")
+
+# -------------------------
+# Field normalisation: each text field is lowercased once per run and reused downstream
+# -------------------------
+_TEXT_FIELDS = ("title", "snippet", "company", "location")
+
+def normalize_jobs(jobs):
+    """
+    Store lowercased copies of the text fields on each job (_title_l, _snippet_l, _company_l,
+    _location_l) plus _combined_l, the four joined by spaces. Returns jobs.
+    """
+    for job in jobs:
+        parts = [(job.get(k) or "").lower() for k in _TEXT_FIELDS]
+        job["_title_l"], job["_snippet_l"], job["_company_l"], job["_location_l"] = parts
+        job["_combined_l"] = " ".join(parts)
+    return jobs
+
+def _lowered(job, field):
+    """Lowercased job[field], taken from normalize_jobs when it has run."""
+    value = job.get(f"_{field}_l")
+    return value if value is not None else (job.get(field) or "").lower()
+
 def score_job(job, user_years=5):
-    text = (job.get("title","") + " " + job.get("snippet","") + " " + job.get("company","")).lower()
+    job["score"], job["matched_keywords"] = _score_text(*_lowered_fields(job))
+    return job
+
+def _lowered_fields(job):
+    """(title, title + snippet + company, location), each lowercased once."""
+    title_l = _lowered(job, "title")
+    text = " ".join((title_l, _lowered(job, "snippet"), _lowered(job, "company")))
+    return title_l, text, _lowered(job, "location")
+
+def _score_text(title_l, text, loc_l):
+    """Score already-lowercased job text; returns (score, matched keywords)."""
     score = 0
     matched = []
 
     # Title exact match boost
-    if re.search(r"\bdata engineer\b", job.get("title","").lower()):
+    if _TITLE_RE.search(title_l):
         score += TITLE_BONUS
         matched.append("title:data engineer")
 
+    # every keyword present in text, found in a single pass (overlapping matches included)
+    hits = {k for _, k in AUTOMATON.iter(text)}
+
     # Seniority
-    if any(k in text for k in SENIOR_KEYWORDS):
+    if not hits.isdisjoint(SENIOR_KEYWORDS):
         score += SENIOR_BONUS
         matched.append("seniority:senior")
-    if any(k in text for k in JUNIOR_KEYWORDS):
+    if not hits.isdisjoint(JUNIOR_KEYWORDS):
         score -= 30  # avoid juniors
         matched.append("seniority:junior")
 
     # Skills
     for k, w in SKILL_KEYWORDS.items():
-        if k in text:
+        if k in hits:
             score += w
             matched.append(k)
 
     # Location preference
-    if "hyderabad" in text or "hyderabad" in (job.get("location","") or "").lower():
+    if LOCATION_KEYWORD in hits or LOCATION_KEYWORD in loc_l:
         score += LOCATION_BONUS
         matched.append("location:hyderabad")
 
     # Visa / sponsorship detectable
-    if any(x in text for x in ("visa", "sponsor", "sponsorship", "relocation")):
+    if not hits.isdisjoint(VISA_KEYWORDS):
         score += SPONSOR_BONUS
         matched.append("visa")
 
@@ -62,10 +113,7 @@ def score_job(job, user_years=5):
     # e.g., you can maintain a list of product domains and check here (left out for speed)
 
     # small base: presence of any word 'data' or 'engineer'
-    if "data" in text or "engineer" in text:
+    if not hits.isdisjoint(BASE_KEYWORDS):
         score += 2
 
-    # Attach score and matched keywords to job object for later usage
-    job["score"] = int(score)
-    job["matched_keywords"] = matched
-    return job
+    return int(score), matched
@@ -1,16 +1,30 @@
 # run_cycle.py
+import logging
+import multiprocessing
 import os
 import re
-import yaml
-import time
-from fetchers import fetch_indeed, fetch_company_jobs
-from matcher import score_job
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
+from logging.handlers import MemoryHandler
+try:
+    import xxhash
+except ImportError:  # optional speed-up; fall back to the builtin str hash
+    xxhash = None
+from fetchers import fetch_indeed, fetch_company_pages
+from matcher import normalize_jobs, score_job
 from tailor_resume import generate_tailored_copy
-from emailer import send_email
+from emailer import Mailer
+from _yaml_cache import load_yaml_cached
+
+log = logging.getLogger("jobbot")
 
 # Load config
 CFG_PATH = "jobbot/config.yaml"
-cfg = yaml.safe_load(open(CFG_PATH, "r", encoding="utf-8"))
+cfg = load_yaml_cached(CFG_PATH)
+
+# PDF workers are forked where possible, so they start with tailor_resume's config, master PDF
+# cache and overlay cache already loaded instead of re-importing everything.
+_POOL_CONTEXT = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
 
 def load_company_pages():
     try:
@@ -29,44 +43,78 @@ def load_company_pages():
         return []
 
 
+def _dedup_key(title_l, company_l, link):
+    # 64-bit fingerprint; fields are joined with NUL, which scraped text never contains,
+    # so ("a|b", "c") and ("a", "b|c") no longer share a key
+    if xxhash:
+        return xxhash.xxh64_intdigest(f"{title_l}\x00{company_l}\x00{link}".encode())
+    return hash((title_l, company_l, link))
+
 def safe_jobs_deduplicate(jobs):
+    # first job wins for each (title, company, link), in input order
     seen = set()
     out = []
     for j in jobs:
-        key = (j.get("title","").lower(), j.get("company","").lower(), j.get("link",""))
+        key = _dedup_key(j.get("title","").lower(), j.get("company","").lower(), j.get("link",""))
         if key not in seen:
             seen.add(key)
             out.append(j)
     return out
 
+# substring markers (so "internship" still counts as junior)
+_JUNIOR_MARKERS = ("intern", "junior", "jr.", "trainee", "fresher", "entry")
+# stdlib re on purpose: RE2's \d and \s are ASCII-only, and parsed pages carry NBSP ("3\xa0years")
+_YEARS_RE = re.compile(r"(\d{1,2})\+?\s*(?:years|yrs|year)", re.I)
+
 def looks_like_azure_data(text):
     """
     Mandatory relevance: must be Azure + data/engineer OR the phrase 'data engineer'
+    Expects lowercased text (main_once passes its lowercased combined_text).
     """
-    text = (text or "").lower()
+    if not text:
+        return False
     if "data engineer" in text:
         return True
-    if "azure" in text and ("data" in text or "engineer" in text):
-        return True
-    return False
+    return "azure" in text and ("data" in text or "engineer" in text)
 
 def contains_junior_marker(text):
-    return any(w in text for w in ("intern", "junior", "jr.", "trainee", "fresher", "entry"))
+    """Expects lowercased text."""
+    return any(w in text for w in _JUNIOR_MARKERS)
+
+_YEAR_UNITS = ("year", "yrs")
+_YEAR_SPACE = " \t\n\r\f\v"
 
 def parse_years(text):
     """
     Attempt to parse an integer number of years from text like '5+ years', '3 years', '6 yrs'
-    Returns integer or None.
+    Returns integer or None. Expects lowercased text (main_once passes _combined_l).
     """
     if not text:
         return None
-    m = re.search(r'(\d{1,2})\+?\s*(?:years|yrs|year)', text.lower())
-    if m:
-        try:
-            return int(m.group(1))
-        except Exception:
+    if not text.isascii():
+        # unicode digits and whitespace (NBSP from &nbsp;): leave those to the stdlib regex
+        m = _YEARS_RE.search(text)
+        return int(m.group(1)) if m else None
+
+    # Fast path, same result as _YEARS_RE: find each "year"/"yrs" left to right and read
+    # back over whitespace, an optional '+' and the (last two) digits before it.
+    pos = 0
+    while True:
+        hits = [i for i in (text.find(u, pos) for u in _YEAR_UNITS) if i >= 0]
+        if not hits:
             return None
-    return None
+        i = min(hits)
+        j = i
+        while j and text[j - 1] in _YEAR_SPACE:
+            j -= 1
+        if j and text[j - 1] == "+":
+            j -= 1
+        end = j
+        while j > end - 2 and j and "0" <= text[j - 1] <= "9":
+            j -= 1
+        if j < end:
+            return int(text[j:end])
+        pos = i + 1
 
 def main_once():
     all_jobs = []
@@ -75,89 +123,96 @@ def main_once():
     try:
         all_jobs += fetch_indeed(query="Azure Data Engineer", location="Hyderabad")
     except Exception as e:
-        print("Indeed fetch failed:", e)
+        log.warning("Indeed fetch failed: %s", e)
 
-    # 2) company career pages
-    for url in load_company_pages():
-        try:
-            all_jobs += fetch_company_jobs(url)
-            time.sleep(1)  # polite pause
-        except Exception as e:
-            print("Company fetch failed for", url, e)
+    # 2) company career pages, fetched concurrently (pages on the same host stay spaced out)
+    try:
+        all_jobs += fetch_company_pages(load_company_pages())
+    except Exception as e:
+        log.warning("Company fetch failed: %s", e)
 
-    # deduplicate
-    all_jobs = safe_jobs_deduplicate(all_jobs)
+    # deduplicate, then lowercase the text fields once for the scorer and the gates
+    all_jobs = normalize_jobs(safe_jobs_deduplicate(all_jobs))
 
     # score jobs
     scored = [score_job(j) for j in all_jobs]
 
-    # final configured threshold
+    # final configured threshold and recipient (looked up once, not per job)
     threshold = cfg.get("score_threshold", 30)
+    to_email = cfg.get("email")
 
     # env SMTP from GitHub Secrets or local env
     smtp_user = os.environ.get("SMTP_USER")
     smtp_pass = os.environ.get("SMTP_PASS")
 
     if not smtp_user or not smtp_pass:
-        print("SMTP_USER and SMTP_PASS environment variables not found. Exiting without sending emails.")
+        log.error("SMTP_USER and SMTP_PASS environment variables not found. Exiting without sending emails.")
         return
 
-    sent_count = 0
+    # gate first, so only jobs that will actually be emailed get a tailored PDF
+    passing = []
     for job in scored:
         try:
-            # normalize combined text for quick checks
-            combined_text = " ".join([
-                job.get("title","") or "",
-                job.get("snippet","") or "",
-                job.get("company","") or "",
-                job.get("location","") or ""
-            ]).lower()
+            combined_text = job["_combined_l"]
 
             # 1) Mandatory Azure + data relevance
             if not looks_like_azure_data(combined_text):
-                print("Skipping (not azure+data):", job.get("title"), job.get("company"))
+                log.debug("Skipping (not azure+data): %s %s", job.get("title"), job.get("company"))
                 continue
 
             # 2) Reject obvious junior roles
             if contains_junior_marker(combined_text):
-                print("Skipping junior role:", job.get("title"), job.get("company"))
+                log.debug("Skipping junior role: %s %s", job.get("title"), job.get("company"))
                 continue
 
             # 3) If job states explicit years and < 5, skip
             years = parse_years(combined_text)
             if years is not None and years < 5:
-                print("Skipping due to experience < 5 years:", years, job.get("title"), job.get("company"))
+                log.debug("Skipping due to experience < 5 years: %s %s %s", years, job.get("title"), job.get("company"))
                 continue
 
             # 4) Final score gate (use configured threshold)
             if job.get("score", 0) < threshold:
-                print("Skipping low score:", job.get("score"), job.get("title"))
+                log.debug("Skipping low score: %s %s", job.get("score"), job.get("title"))
                 continue
 
-            # Passed all gates -> create tailored resume + email
-            text_resume, pdf_path = generate_tailored_copy(job)
-
-            subject = f"[JobBot] {job.get('title','')} @ {job.get('company','')}  Score:{job.get('score',0)}"
-            body = (
-                f"Role: {job.get('title','')}\n"
-                f"Company: {job.get('company','')}\n"
-                f"Link: {job.get('link','')}\n\n"
-                f"Match Score: {job.get('score',0)}\n\n"
-                f"Tailored Resume (text summary):\n\n{text_resume}\n"
-            )
-            send_email(smtp_user, smtp_pass, cfg.get("email"), subject, body, attachments=[pdf_path])
-            sent_count += 1
-            print("Emailed job:", job.get("title"), job.get("company"), " score:", job.get("score",0))
-            # small pause so SMTP and file IO behave nicely
-            time.sleep(2)
-
+            passing.append(job)
         except Exception as e:
-            print("Failed to process job:", job.get("title"), job.get("company"), e)
+            log.warning("Failed to process job: %s %s %s", job.get("title"), job.get("company"), e)
+
+    sent_count = 0
+    if passing:
+        # PDF rendering is CPU-bound, so tailored copies are built in worker processes and each
+        # email goes out as soon as its PDF is ready, while the rest are still rendering.
+        # one SMTP connection for the whole batch: opened by the first email, closed at the end
+        with ProcessPoolExecutor(max_workers=min(len(passing), os.cpu_count() or 1),
+                                 mp_context=_POOL_CONTEXT) as pool, \
+                closing(Mailer(smtp_user, smtp_pass)) as mailer:
+            futures = {pool.submit(generate_tailored_copy, job): job for job in passing}
+            for fut in as_completed(futures):
+                job = futures[fut]
+                try:
+                    text_resume, pdf_path = fut.result()
+
+                    subject = f"[JobBot] {job.get('title','')} @ {job.get('company','')}  Score:{job.get('score',0)}"
+                    body = (
+                        f"Role: {job.get('title','')}\n"
+                        f"Company: {job.get('company','')}\n"
+                        f"Link: {job.get('link','')}\n\n"
+                        f"Match Score: {job.get('score',0)}\n\n"
+                        f"Tailored Resume (text summary):\n\n{text_resume}\n"
+                    )
+                    mailer.send(to_email, subject, body, attachments=[pdf_path])
+                    sent_count += 1
+                    log.info("Emailed job: %s %s  score: %s", job.get("title"), job.get("company"), job.get("score",0))
+
+                except Exception as e:
+                    log.warning("Failed to process job: %s %s %s", job.get("title"), job.get("company"), e)
 
 
         # DEBUG: if nothing sent, create a test tailored PDF for verification.
     if sent_count == 0:
-        print("No emails sent — creating a sample tailored PDF for verification.")
+        log.info("No emails sent — creating a sample tailored PDF for verification.")
         test_job = {
             "title": "Senior Azure Data Engineer (Test)",
             "company": "TestCompany",
@@ -168,12 +223,17 @@ def main_once():
         }
         try:
             text_resume, pdf_path = generate_tailored_copy(test_job)
-            print("Created test PDF at:", pdf_path)
+            log.info("Created test PDF at: %s", pdf_path)
         except Exception as e:
-            print("Failed to create test PDF:", e)
+            log.warning("Failed to create test PDF: %s", e)
 
 
-    print(f"Run complete. Emails sent: {sent_count}")
+    log.info("Run complete. Emails sent: %s", sent_count)
 
 if __name__ == "__main__":
+    # buffer log lines and write them out 256 at a time (warnings and errors flush right away);
+    # set JOBBOT_LOG_LEVEL=DEBUG to see why each job was skipped
+    logging.basicConfig(handlers=[MemoryHandler(256, flushLevel=logging.WARNING,
+                                                target=logging.StreamHandler())])
+    log.setLevel(os.environ.get("JOBBOT_LOG_LEVEL", "INFO").upper())
     main_once()
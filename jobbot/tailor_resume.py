@@ -1,15 +1,21 @@
 # tailor_resume.py
-import yaml
-import textwrap
+import hashlib
+import io
+import tempfile
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfgen import canvas
+from reportlab.platypus import Frame, Paragraph, Spacer
 from PyPDF2 import PdfReader, PdfWriter
 from datetime import datetime
+from xml.sax.saxutils import escape
 import os
+from _yaml_cache import load_yaml_cached
 
 # Config / paths
 CFG_PATH = "jobbot/config.yaml"
-cfg = yaml.safe_load(open(CFG_PATH, "r", encoding="utf-8"))
+cfg = load_yaml_cached(CFG_PATH)
 
 MASTER_PDF = "jobbot/Sandeep_Resume_N.pdf"   # your master file (must exist)
 OUT_DIR = "jobbot"
@@ -22,28 +28,53 @@ TERMS = [
 ]
 
 def extract_keywords(job):
-    text = (job.get("title", "") + " " + job.get("snippet", "")).lower()
+    if "_title_l" in job:  # already lowercased by matcher.normalize_jobs
+        text = job["_title_l"] + " " + job["_snippet_l"]
+    else:
+        text = (job.get("title", "") + " " + job.get("snippet", "")).lower()
     return [t for t in TERMS if t in text]
 
-def build_overlay_pdf(job, keywords, overlay_path,
-                      page_size=A4,
-                      # default coordinates and box size for summary area (tweakable)
-                      box_x=40, box_y=540, box_w=520, box_h=220,
-                      left_margin=48, top_y=None, line_height=14):
+# Overlay placement on the master's first page.
+# Tweak these if the overlay does not align with your template.
+OVERLAY_LAYOUT = dict(box_x=40, box_y=520, box_w=520, box_h=240, left_margin=48, line_height=14)
+
+# Body overlays depend only on the matched keywords, so they are rendered once per keyword set.
+OVERLAY_CACHE_DIR = os.path.join(tempfile.gettempdir(), "jobbot_overlays")
+OVERLAY_VERSION = 2  # bump when the body overlay drawing changes
+
+# Tailored bullets - simple sentences to show relevant highlights, keyed by the TERMS that trigger them
+_KEYWORD_BULLETS = {
+    frozenset(("azure", "data factory")):
+        "• Experienced in building Azure Data Factory pipelines for ingestion and orchestration.",
+    frozenset(("databricks", "delta lake")):
+        "• Designed Databricks notebooks and Delta Lake tables for reliable pipelines.",
+    frozenset(("pyspark", "spark")):
+        "• Implemented PySpark transformations and performance tuning.",
+}
+# generic bullets to fill
+_GENERIC_BULLETS = (
+    "• Strong SQL, Python, ETL, and data modeling skills across cloud platforms.",
+    "• 5+ years experience building production data platforms, ETL and automation.",
+)
+
+@lru_cache(maxsize=256)
+def _build_bullets(keys):
+    """Tailored bullets for a frozenset of matched TERMS."""
+    return tuple(b for triggers, b in _KEYWORD_BULLETS.items() if not triggers.isdisjoint(keys)) + _GENERIC_BULLETS
+
+def build_header_overlay_pdf(job, overlay_path,
+                             page_size=A4,
+                             box_x=40, box_y=540, box_w=520, box_h=220,
+                             left_margin=48, top_y=None, line_height=14):
     """
-    Create an overlay PDF page (single page) with a white box and tailored text drawn inside.
-    box_x, box_y, box_w, box_h specify the white rectangle that will hide the original text.
-    top_y is optional; if None we compute from box_y+box_h.
+    Create the per-job overlay page: heading, role title, company and a footer timestamp.
+    It has no white box of its own; it is merged on top of the body overlay, which does.
     Coordinates are in points, origin (0,0) at lower-left (ReportLab default).
     """
-
-    w, h = page_size
     if top_y is None:
         top_y = box_y + box_h - 10
 
     c = canvas.Canvas(overlay_path, pagesize=page_size)
-    c.setFillColorRGB(1, 1, 1)   # white
-    c.rect(box_x, box_y, box_w, box_h, fill=1, stroke=0)  # white-out area under tailored text
 
     # Draw header
     c.setFont("Helvetica-Bold", 14)
@@ -59,39 +90,6 @@ def build_overlay_pdf(job, keywords, overlay_path,
     c.setFont("Helvetica", 10)
     company_line = f"Company: {job.get('company','')}"
     c.drawString(left_margin, y, company_line)
-    y -= 16
-
-    # Matched keywords
-    if keywords:
-        kws = "Matched keywords: " + ", ".join(keywords)
-        wrapped = textwrap.wrap(kws, width=90)
-        for ln in wrapped:
-            c.drawString(left_margin, y, ln)
-            y -= line_height
-
-    # Tailored bullets - simple sentences to show relevant highlights
-    y -= 6
-    bullets = []
-    text_lower = (job.get("title","") + " " + job.get("snippet","")).lower()
-    if any(k in text_lower for k in ("azure", "data factory")):
-        bullets.append("• Experienced in building Azure Data Factory pipelines for ingestion and orchestration.")
-    if any(k in text_lower for k in ("databricks", "delta lake")):
-        bullets.append("• Designed Databricks notebooks and Delta Lake tables for reliable pipelines.")
-    if any(k in text_lower for k in ("pyspark", "spark")):
-        bullets.append("• Implemented PySpark transformations and performance tuning.")
-
-    # generic bullets to fill
-    bullets.append("• Strong SQL, Python, ETL, and data modeling skills across cloud platforms.")
-    bullets.append("• 5+ years experience building production data platforms, ETL and automation.")
-
-    c.setFont("Helvetica", 10)
-    for b in bullets:
-        if y < box_y + 12:  # don't overflow the white box
-            break
-        for ln in textwrap.wrap(b, width=95):
-            c.drawString(left_margin, y, ln)
-            y -= line_height
-        y -= 2
 
     # footer small metadata
     footer = f"Generated: {datetime.utcnow().isoformat()} UTC"
@@ -102,38 +100,116 @@ def build_overlay_pdf(job, keywords, overlay_path,
     c.save()
     return overlay_path
 
-def merge_overlay_with_master(overlay_path, master_path, out_path):
+def build_body_overlay_pdf(keywords, overlay_path,
+                           page_size=A4,
+                           # default coordinates and box size for summary area (tweakable)
+                           box_x=40, box_y=540, box_w=520, box_h=220,
+                           left_margin=48, top_y=None, line_height=14):
     """
-    Merge single-page overlay with first page of master_path, keep other pages as-is.
-    overlay_path: PDF with same page size (generated by ReportLab)
+    Create the keyword-dependent overlay page: a white box that hides the original text,
+    the matched keywords and the tailored bullets, laid out below the header lines.
+    box_x, box_y, box_w, box_h specify the white rectangle.
+    top_y is optional; if None we compute from box_y+box_h.
     """
-    reader_overlay = PdfReader(overlay_path)
-    reader_master = PdfReader(master_path)
+    if top_y is None:
+        top_y = box_y + box_h - 10
+
+    c = canvas.Canvas(overlay_path, pagesize=page_size)
+    c.setFillColorRGB(1, 1, 1)   # white
+    c.rect(box_x, box_y, box_w, box_h, fill=1, stroke=0)  # white-out area under tailored text
+    c.setFillColorRGB(0, 0, 0)
+
+    # Matched keywords and tailored bullets, wrapped by ReportLab into one frame that ends at
+    # the bottom of the white box; whatever does not fit is left out.
+    body_style = ParagraphStyle("overlay_body", fontName="Helvetica", fontSize=10,
+                                leading=line_height, spaceAfter=2)
+    paras = []
+    if keywords:
+        kws = "Matched keywords: " + ", ".join(keywords)
+        paras.append(Paragraph(escape(kws), body_style))
+    paras.append(Spacer(0, 4 if keywords else 6))  # 6pt gap before the bullets
+    paras += [Paragraph(escape(b), body_style) for b in _build_bullets(frozenset(keywords))]
+
+    first_baseline = top_y - 22 - 18 - 16  # below the heading, title and company lines of the header overlay
+    frame_top = first_baseline + line_height - 2  # leave room above the first baseline for the ascenders
+    Frame(left_margin, box_y + 2, box_x + box_w - left_margin, frame_top - box_y - 2,
+          leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0).addFromList(paras, c)
+
+    c.showPage()
+    c.save()
+    return overlay_path
+
+def _body_overlay_path(keywords):
+    """Path of the cached body overlay for this keyword list, rendering it on first use."""
+    # the bullet text is part of the key, so editing _KEYWORD_BULLETS can't serve a stale overlay
+    key = repr((OVERLAY_VERSION, tuple(keywords), _build_bullets(frozenset(keywords)),
+                sorted(OVERLAY_LAYOUT.items())))
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    path = os.path.join(OVERLAY_CACHE_DIR, f"body_{digest}.pdf")
+    if not os.path.exists(path):
+        os.makedirs(OVERLAY_CACHE_DIR, exist_ok=True)
+        # render to a temp name and rename, so a concurrent reader never sees a partial file
+        fd, tmp = tempfile.mkstemp(suffix=".pdf", dir=OVERLAY_CACHE_DIR)
+        os.close(fd)
+        build_body_overlay_pdf(keywords, tmp, **OVERLAY_LAYOUT)
+        os.replace(tmp, path)
+    return path
+
+_master_cache = {}  # absolute path -> (mtime_ns, size, file bytes)
+
+def _master_bytes(master_path):
+    """Raw bytes of the master PDF, read from disk only when the file has changed."""
+    st = os.stat(master_path)
+    key = os.path.abspath(master_path)
+    entry = _master_cache.get(key)
+    if entry is None or entry[:2] != (st.st_mtime_ns, st.st_size):
+        with open(master_path, "rb") as f:
+            entry = _master_cache[key] = (st.st_mtime_ns, st.st_size, f.read())
+    return entry[2]
+
+def _merge_onto_master(overlay_paths, master_bytes):
+    """PdfWriter holding the master with overlay_paths merged, in order, onto its first page."""
+    # fresh reader per call (merge_page mutates the page), parsed from the in-memory copy
+    reader_master = PdfReader(io.BytesIO(master_bytes))
     writer = PdfWriter()
 
-    # Merge overlay onto the first page
+    # Merge overlays onto the first page
     master_first = reader_master.pages[0]
-    overlay_page = reader_overlay.pages[0]
 
     # Merge: overlay on top of master => we add master page first, then merge overlay on top
     # PyPDF2 supports merge_page on page object
-    try:
-        master_first.merge_page(overlay_page)   # overlay drawn on top of master
-    except Exception:
-        # alternate try: combine by adding overlay then master? But merge_page should work.
-        pass
+    for overlay_path in overlay_paths:
+        overlay_page = PdfReader(overlay_path).pages[0]
+        try:
+            master_first.merge_page(overlay_page)   # overlay drawn on top of master
+        except Exception:
+            # alternate try: combine by adding overlay then master? But merge_page should work.
+            pass
 
     writer.add_page(master_first)
 
     # append remaining master pages unchanged
     for p in reader_master.pages[1:]:
         writer.add_page(p)
+    return writer
 
+def _write_pdf(writer, out_path):
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "wb") as f:
         writer.write(f)
     return out_path
 
+@lru_cache(maxsize=32)
+def _master_with_body(body_overlay, master_path, master_mtime_ns, master_size):
+    """
+    PDF bytes of the master with one cached body overlay already merged. Jobs with the same
+    keywords share it, so each tailored copy only merges its small header overlay.
+    The master's mtime and size are part of the key, so an edited master is merged afresh.
+    """
+    buf = io.BytesIO()
+    _merge_onto_master([body_overlay], _master_bytes(master_path)).write(buf)
+    return buf.getvalue()
+
 def generate_tailored_copy(job):
     """
     Main function called by run_cycle. Produces (text_summary, pdf_path).
@@ -143,22 +219,32 @@ def generate_tailored_copy(job):
     title = job.get("title","").strip().replace(" ", "_")[:40]
     company = job.get("company","").strip().replace(" ", "_")[:30]
     ts = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    out_name = f"tailored_resume_{title}_{company}_{ts}.pdf"
-    out_path = os.path.join(OUT_DIR, out_name)
-
-    overlay_tmp = os.path.join(OUT_DIR, f"overlay_{ts}.pdf")
-    build_overlay_pdf(job, keywords, overlay_tmp,
-                      # Tweak these defaults if the overlay does not align with your template.
-                      box_x=40, box_y=520, box_w=520, box_h=240,
-                      left_margin=48, line_height=14)
-
-    final = merge_overlay_with_master(overlay_tmp, MASTER_PDF, out_path)
-
-    # cleanup overlay (optional)
+    # mkstemp claims a unique name, so pool workers rendering the same title/company in the
+    # same second never write to one file
+    os.makedirs(OUT_DIR, exist_ok=True)
+    fd, out_path = tempfile.mkstemp(prefix=f"tailored_resume_{title}_{company}_{ts}_", suffix=".pdf", dir=OUT_DIR)
+    os.close(fd)
+
+    # body (white box, keywords, bullets) is merged onto the master once per keyword set;
+    # only the header is rendered and merged per job
+    body_overlay = _body_overlay_path(keywords)
+    fd, header_tmp = tempfile.mkstemp(prefix="overlay_", suffix=".pdf")
+    os.close(fd)
     try:
-        os.remove(overlay_tmp)
+        build_header_overlay_pdf(job, header_tmp, **OVERLAY_LAYOUT)
+        st = os.stat(MASTER_PDF)
+        base = _master_with_body(body_overlay, MASTER_PDF, st.st_mtime_ns, st.st_size)
+        final = _write_pdf(_merge_onto_master([header_tmp], base), out_path)
     except Exception:
-        pass
+        # don't leave the empty placeholder behind to be attached or uploaded
+        os.remove(out_path)
+        raise
+    finally:
+        # cleanup overlay (optional)
+        try:
+            os.remove(header_tmp)
+        except Exception:
+            pass
 
     text_summary = f"Tailored summary for {job.get('title','')} at {job.get('company','')}. Matched: {', '.join(keywords)}"
     return text_summary, final
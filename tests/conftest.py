@@ -0,0 +1,9 @@
+# conftest.py
+import os
+import sys
+
+# The jobbot modules are flat scripts run from the repo root (python jobbot/run_cycle.py):
+# they import each other by bare name and resolve "jobbot/..." paths from the root.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "jobbot"))
+os.chdir(ROOT)
@@ -0,0 +1,40 @@
+# test_emailer.py
+import logging
+
+import emailer
+
+class _FakeSMTP:
+    """Records what Mailer does with its SMTP_SSL connection."""
+    instances = []
+
+    def __init__(self, host, port, context=None):
+        self.sent = []
+        _FakeSMTP.instances.append(self)
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        self.sent.append(msg["Subject"])
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+def test_mailer_sends_batch_on_one_connection_and_logs(monkeypatch, caplog):
+    _FakeSMTP.instances.clear()
+    monkeypatch.setattr(emailer.smtplib, "SMTP_SSL", _FakeSMTP)
+    with caplog.at_level(logging.INFO, logger="jobbot"):
+        with emailer.Mailer("me@example.com", "pw") as mailer:
+            mailer.send("you@example.com", "one", "body")
+            mailer.send("you@example.com", "two", "body", attachments=["does/not/exist.pdf"])
+
+    [conn] = _FakeSMTP.instances
+    assert conn.sent == ["one", "two"]
+    assert [(r.levelname, r.getMessage()) for r in caplog.records] == [
+        ("INFO", "Email sent to you@example.com with subject: one"),
+        ("WARNING", "Could not attach does/not/exist.pdf -> [Errno 2] No such file or directory: 'does/not/exist.pdf'"),
+        ("INFO", "Email sent to you@example.com with subject: two"),
+    ]
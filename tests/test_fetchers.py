@@ -0,0 +1,128 @@
+# test_fetchers.py
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import httpx
+import pytest
+import requests
+from selectolax.lexbor import LexborHTMLParser
+
+import fetchers
+from fetchers import _node_text, _parse_company_jobs, _parse_indeed_results, _parse_linkedin_results, fetch_indeed
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+# expected_jobs.json is what the BeautifulSoup parsers returned for these pages, minus posted_at
+EXPECTED_JOBS = json.loads(_fixture("expected_jobs.json"))
+PARSERS = [
+    ("linkedin", "linkedin_google.html", lambda body: _parse_linkedin_results(body, "Hyderabad")),
+    ("indeed", "indeed_results.html", lambda body: _parse_indeed_results(body, "Hyderabad")),
+    ("company", "company_careers.html", lambda body: _parse_company_jobs(body, "https://www.acme.example/careers/")),
+]
+
+@pytest.mark.parametrize("source, page, parse", PARSERS, ids=[p[0] for p in PARSERS])
+def test_parser_fixture(source, page, parse):
+    jobs = parse(_fixture(page))
+    assert [{k: v for k, v in j.items() if k != "posted_at"} for j in jobs] == EXPECTED_JOBS[source]
+    # one fetch time per page, as an ISO timestamp
+    assert len({j["posted_at"] for j in jobs}) == 1
+    datetime.fromisoformat(jobs[0]["posted_at"])
+
+# (html, separator, what BeautifulSoup's get_text(separator, strip=True) returned before selectolax)
+BS4_TEXT = [
+    ("<a> <b>Data</b>  <i> Engineer </i>\n</a>", " ", "Data Engineer"),
+    ("<a> <b>Data</b>  <i> Engineer </i>\n</a>", "", "DataEngineer"),
+    ("<a>Data<span> </span>Engineer</a>", " ", "Data Engineer"),
+    ("<a>\n  Senior\n  Data   Engineer\n</a>", " ", "Senior\n  Data   Engineer"),
+    ("<a><b>Data</b><b>Engineer</b></a>", " ", "Data Engineer"),
+    ("<a>&nbsp;Data&nbsp;Engineer</a>", " ", "Data\xa0Engineer"),
+    ("<a>x<br>y</a>", " ", "x y"),
+    ("<a> </a>", " ", ""),
+]
+
+@pytest.mark.parametrize("html, separator, expected", BS4_TEXT)
+def test_node_text_matches_bs4(html, separator, expected):
+    node = LexborHTMLParser(html).css_first("a")
+    assert _node_text(node, separator) == expected
+
+def test_linkedin_title_has_no_stray_spaces():
+    html = '<a href="/url?q=https://in.linkedin.com/jobs/view/1&sa=U"> <span>Senior</span> <b>Data Engineer</b> </a>'
+    [job] = _parse_linkedin_results(html, "Hyderabad")
+    assert job["title"] == "Senior Data Engineer"
+
+def test_indeed_snippet_has_no_stray_spaces():
+    html = ('<div class="result"><h2 class="jobTitle"> <a><span>Azure Data Engineer</span></a> </h2>'
+            '<div class="job-snippet"> <li>Spark</li> <li>SQL</li> </div></div>')
+    [job] = _parse_indeed_results(html, "Hyderabad")
+    assert job["title"] == "Azure Data Engineer"
+    assert job["snippet"] == "Spark SQL"
+
+def test_indeed_card_matching_several_layouts_is_parsed_once():
+    html = ('<a class="tapItem result" href="/rc/clk?jk=1"><h2 class="jobTitle">Data Engineer</h2></a>'
+            '<a class="tapItem result" href="/rc/clk?jk=2"><h2 class="jobTitle">Azure Engineer</h2></a>')
+    jobs = _parse_indeed_results(html, "Hyderabad")
+    assert [j["link"] for j in jobs] == ["https://in.indeed.com/rc/clk?jk=1", "https://in.indeed.com/rc/clk?jk=2"]
+
+def test_indeed_uses_first_layout_found():
+    # like the old per-layout loop: .result cards win, the tapItem nested inside is not a card of its own
+    html = ('<div class="result"><h2 class="jobTitle">Outer</h2>'
+            '<a class="tapItem" href="/rc/clk?jk=1"><span class="title">Inner</span></a></div>')
+    assert [j["title"] for j in _parse_indeed_results(html, "Hyderabad")] == ["Outer"]
+
+class _FakeSession:
+    """Stands in for the cached session: every GET returns the same canned response."""
+    def __init__(self, body, content_type):
+        self.body = body
+        self.content_type = content_type
+
+    def get(self, url, **kwargs):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = url
+        resp.headers["Content-Type"] = self.content_type
+        resp._content = self.body
+        return resp
+
+def test_indeed_page_is_decoded_with_its_declared_charset():
+    html = '<div class="result"><h2 class="jobTitle">Ingeniero de datos en Málaga</h2></div>'
+    session = _FakeSession(html.encode("iso-8859-1"), "text/html; charset=ISO-8859-1")
+    [job] = fetch_indeed(session=session)
+    assert job["title"] == "Ingeniero de datos en Málaga"
+
+def test_async_company_fetch_respects_caps_and_reads_robots_once(monkeypatch):
+    in_flight = {"total": 0, "max_total": 0}
+    per_host, max_per_host, robots_hits = {}, {}, {}
+
+    async def handler(request):
+        host = request.url.host
+        if request.url.path == "/robots.txt":
+            robots_hits[host] = robots_hits.get(host, 0) + 1
+            return httpx.Response(404)
+        in_flight["total"] += 1
+        per_host[host] = per_host.get(host, 0) + 1
+        in_flight["max_total"] = max(in_flight["max_total"], in_flight["total"])
+        max_per_host[host] = max(max_per_host.get(host, 0), per_host[host])
+        await asyncio.sleep(0.01)
+        in_flight["total"] -= 1
+        per_host[host] -= 1
+        return httpx.Response(200, text='<a href="/jobs/1">Data Engineer</a>')
+
+    monkeypatch.setattr(fetchers, "POLITE_DELAY", 0)
+    monkeypatch.setattr(fetchers, "_crawl_delays", {})
+    monkeypatch.setattr(fetchers, "_last_hit", {})
+    monkeypatch.setattr(fetchers, "_async_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    hosts = [f"careers{i}.example.com" for i in range(6)]
+    urls = [f"https://{h}/careers?page={p}" for h in hosts for p in range(5)]
+    jobs = fetchers.fetch_company_pages(urls)
+
+    assert len(jobs) == len(urls)
+    assert in_flight["max_total"] <= fetchers.MAX_CONCURRENT_FETCHES
+    assert max(max_per_host.values()) <= fetchers.MAX_PER_HOST
+    assert robots_hits == {h: 1 for h in hosts}
@@ -0,0 +1,74 @@
+# test_matcher.py
+import random
+import re
+
+import pytest
+
+from matcher import (JUNIOR_KEYWORDS, LOCATION_BONUS, SENIOR_BONUS, SENIOR_KEYWORDS, SKILL_KEYWORDS,
+                     SPONSOR_BONUS, TITLE_BONUS, normalize_jobs, score_job)
+
+def baseline_score(job):
+    """score_job as it was before the automaton and the field normalisation: one substring test per keyword."""
+    text = (job.get("title","") + " " + job.get("snippet","") + " " + job.get("company","")).lower()
+    score = 0
+    matched = []
+    if re.search(r"\bdata engineer\b", job.get("title","").lower()):
+        score += TITLE_BONUS
+        matched.append("title:data engineer")
+    if any(k in text for k in SENIOR_KEYWORDS):
+        score += SENIOR_BONUS
+        matched.append("seniority:senior")
+    if any(k in text for k in JUNIOR_KEYWORDS):
+        score -= 30
+        matched.append("seniority:junior")
+    for k, w in SKILL_KEYWORDS.items():
+        if k in text:
+            score += w
+            matched.append(k)
+    if "hyderabad" in text or "hyderabad" in (job.get("location","") or "").lower():
+        score += LOCATION_BONUS
+        matched.append("location:hyderabad")
+    if any(x in text for x in ("visa", "sponsor", "sponsorship", "relocation")):
+        score += SPONSOR_BONUS
+        matched.append("visa")
+    if "data" in text or "engineer" in text:
+        score += 2
+    return score, matched
+
+WORDS = [
+    "Senior", "sr.", "Lead", "intern", "internship", "Junior", "jr.", "jr", "trainee", "entry",
+    "Azure", "Databricks", "data factory", "Synapse", "delta lake", "PySpark", "spark", "Python",
+    "SQL", "ETL", "CI/CD", "lakehouse", "Hyderabad", "visa", "sponsorship", "relocation",
+    "data", "engineer", "Data Engineer", "data engineering", "dataengineer", "Engineerä",
+    "manager", "architect", "5+ years", "3\xa0yrs", "foo", "-", "",
+]
+
+def _random_jobs(n, seed):
+    rng = random.Random(seed)
+    def text(k):
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, k)))
+    return [{"title": text(4), "snippet": text(8), "company": rng.choice(["Acme", "Hyderabad Labs", "", "DATA co"]),
+             "location": rng.choice(["", "Hyderabad", None, "Bangalore"]), "link": f"https://x/{i}"}
+            for i in range(n)]
+
+JOBS = _random_jobs(3000, seed=1)
+
+@pytest.mark.parametrize("normalized", [False, True])
+def test_score_job_matches_baseline(normalized):
+    jobs = [dict(j) for j in JOBS]
+    if normalized:
+        normalize_jobs(jobs)
+    for job in jobs:
+        score_job(job)
+        assert (job["score"], job["matched_keywords"]) == baseline_score(job), job
+
+@pytest.mark.parametrize("job, expected", [
+    ({"title": "Senior Data Engineer", "snippet": "Azure Databricks", "company": "Acme", "location": "Hyderabad"},
+     (40 + 25 + 20 + 18 + 20 + 2, ["title:data engineer", "seniority:senior", "azure", "databricks", "location:hyderabad"])),
+    ({"title": "Data Engineering Intern", "snippet": "", "company": "", "location": ""},
+     (-30 + 2, ["seniority:junior"])),
+    ({"title": "", "snippet": "", "company": "", "location": None}, (0, [])),
+])
+def test_score_job_examples(job, expected):
+    score_job(job)
+    assert (job["score"], job["matched_keywords"]) == expected
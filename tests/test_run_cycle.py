@@ -0,0 +1,78 @@
+# test_run_cycle.py
+import random
+import re
+
+import pytest
+
+from matcher import normalize_jobs
+from run_cycle import contains_junior_marker, looks_like_azure_data, parse_years, safe_jobs_deduplicate
+
+# the main_once gates as they were before precompiling, the str.find scanner and normalize_jobs
+def baseline_looks_like_azure_data(text):
+    text = (text or "").lower()
+    if "data engineer" in text:
+        return True
+    return "azure" in text and ("data" in text or "engineer" in text)
+
+def baseline_contains_junior_marker(text):
+    return any(w in text for w in ("intern", "junior", "jr.", "trainee", "fresher", "entry"))
+
+def baseline_parse_years(text):
+    if not text:
+        return None
+    m = re.search(r'(\d{1,2})\+?\s*(?:years|yrs|year)', text.lower())
+    return int(m.group(1)) if m else None
+
+def baseline_dedup(jobs):
+    seen = set()
+    out = []
+    for j in jobs:
+        key = (j.get("title","").lower(), j.get("company","").lower(), j.get("link",""))
+        if key not in seen:
+            seen.add(key)
+            out.append(j)
+    return out
+
+WORDS = [
+    "azure", "Azure", "data", "engineer", "data engineer", "Data Engineer", "datazure", "intern",
+    "internship", "junior", "jr.", "jr", "trainee", "fresher", "entry", "re-entry", "5+ years",
+    "3 yrs", "10 YEARS", "123 years", "year", "2+\tyear", "7\xa0years", "٣ years", "1 yr",
+    "senior", "spark", "•", "x", " ",
+]
+
+def _random_texts(n, seed):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 8))) for _ in range(n)]
+
+TEXTS = _random_texts(20000, seed=7) + ["", "5 years 3 yrs", "a3years", "99+years"]
+
+def test_gates_match_baseline():
+    # main_once hands the gates normalize_jobs' lowercased _combined_l
+    for text in TEXTS:
+        lowered = text.lower()
+        assert looks_like_azure_data(lowered) == baseline_looks_like_azure_data(text), text
+        assert contains_junior_marker(lowered) == baseline_contains_junior_marker(lowered), text
+        assert parse_years(lowered) == baseline_parse_years(text), text
+
+@pytest.mark.parametrize("text, years", [
+    ("5+ years of azure", 5),
+    ("3 yrs", 3),
+    ("123 years", 23),
+    ("senior, 7\xa0years", 7),
+    ("no stated experience", None),
+])
+def test_parse_years_examples(text, years):
+    assert parse_years(text) == years
+
+def test_dedup_matches_baseline_and_keeps_first():
+    rng = random.Random(3)
+    jobs = [{"title": rng.choice(["Data Engineer", "data engineer", "Lead"]), "company": rng.choice(["Acme", "ACME", "Beta"]),
+             "link": rng.choice(["https://x/1", "https://x/2"]), "n": i} for i in range(500)]
+    assert [j["n"] for j in safe_jobs_deduplicate(jobs)] == [j["n"] for j in baseline_dedup(jobs)]
+
+def test_gates_on_normalized_job():
+    [job] = normalize_jobs([{"title": "Azure Data Engineer", "snippet": "5+ Years", "company": "Acme", "location": "Hyderabad"}])
+    combined = job["_combined_l"]
+    assert looks_like_azure_data(combined)
+    assert not contains_junior_marker(combined)
+    assert parse_years(combined) == 5